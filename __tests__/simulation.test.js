@@ -100,6 +100,35 @@ describe('Simulation', () => {
         expect(simulation.paused).toBe(wasPaused)
     })
 
+    test('should reset to initial state', () => {
+        simulation.initialize()
+        const oldEventManager = simulation.eventManager
+        simulation.agents = [{ type: 'fan', x: 100, y: 100 }]
+        simulation.paused = true
+        simulation.simulationSpeed = 5.0
+        simulation.simulationTime = 1000
+        simulation.renderer.showAllPaths = true
+        simulation.lastFrameTime = 500
+        simulation.lastRenderTime = 500
+        simulation.frameCount = 12
+        simulation.fpsUpdateTime = 400
+        simulation.currentFPS = 60
+
+        simulation.reset()
+
+        expect(simulation.agents).toEqual([])
+        expect(simulation.paused).toBe(false)
+        expect(simulation.simulationSpeed).toBe(mockConfig.DEFAULT_SIMULATION_SPEED)
+        expect(simulation.simulationTime).toBe(0)
+        expect(simulation.eventManager).not.toBe(oldEventManager)
+        expect(simulation.renderer.showAllPaths).toBe(false)
+        expect(simulation.lastFrameTime).toBe(0)
+        expect(simulation.lastRenderTime).toBe(0)
+        expect(simulation.frameCount).toBe(0)
+        expect(simulation.fpsUpdateTime).toBe(0)
+        expect(simulation.currentFPS).toBe(0)
+    })
+
     test('should have update method', () => {
         expect(typeof simulation.update).toBe('function')
     })
@@ -0,0 +1,127 @@
+"""
+Pytest configuration for the Festival Agent Simulation Selenium tests
+Provides the WebDriver fixtures and command line options
+"""
+
+import atexit
+import os
+import pytest
+from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.driver_finder import DriverFinder
+
+DEFAULT_URL = "http://localhost:8000"
+
+# Elements looked up on the shared driver; cached once per session
+ELEMENT_IDS = ("leftConcertBtn", "rightConcertBtn", "busArriveBtn", "fps")
+
+
+def _build_options():
+    """Chrome options shared by every session this process starts"""
+    options = Options()
+    options.add_argument('--headless=new')
+    # Skip Chrome subsystems the tests never use
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-default-apps')
+    options.add_argument('--disable-sync')
+    options.add_argument('--no-first-run')
+    options.add_argument('--disable-translate')
+    # Only needed in privileged containers or with a small /dev/shm
+    if os.environ.get("CI_CONTAINER"):
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+    # Return from get() at DOMContentLoaded; readiness is awaited in _start_driver
+    options.page_load_strategy = 'eager'
+    return options
+
+
+_OPTIONS = _build_options()
+
+_service = None
+
+
+def chromedriver_service():
+    """Start chromedriver once per process and keep it alive until exit"""
+    global _service
+    if _service is None:
+        # Port 0 picks a free port so each xdist worker gets its own service
+        _service = Service(executable_path=os.environ.get("CHROMEDRIVER"))
+        # Locate (or download) chromedriver through Selenium Manager, as
+        # webdriver.Chrome would; CHROMEDRIVER takes precedence when set
+        _service.path = DriverFinder(_service, _OPTIONS).get_driver_path()
+        _service.start()
+        atexit.register(_service.stop)
+    return _service
+
+
+def pytest_addoption(parser):
+    parser.addoption("--url", default=DEFAULT_URL,
+                     help="URL the simulation is served from")
+    parser.addoption("--remote-url", default=os.environ.get("SELENIUM_REMOTE_URL"),
+                     help="WebDriver endpoint of an already running browser "
+                          "container (e.g. http://localhost:3000/webdriver); "
+                          "a local chromedriver is started when omitted")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "mutates: test changes simulation state; the page is reset afterwards"
+    )
+
+
+def _start_driver(config):
+    """Open the app in a new browser session and wait for the first rendered frame"""
+    # A persistent browser container keeps Chrome warm across runs
+    command_executor = (config.getoption("--remote-url")
+                        or chromedriver_service().service_url)
+    driver = webdriver.Remote(command_executor=command_executor, options=_OPTIONS)
+    try:
+        driver.get(config.getoption("--url"))
+
+        # The app sets simulationReady once the canvas is bound and the loop started
+        WebDriverWait(driver, 10).until(
+            lambda d: d.execute_script("return window.simulationReady === true")
+        )
+        # Two animation frames guarantee at least one frame has been rendered
+        driver.execute_async_script("""
+            const done = arguments[0];
+            requestAnimationFrame(() => requestAnimationFrame(done));
+        """)
+    except BaseException:
+        # The fixture never reaches its teardown, so close the session here
+        driver.quit()
+        raise
+
+    return driver
+
+
+@pytest.fixture(scope="session")
+def shared_driver(request):
+    """One WebDriver per session (and so one per xdist worker)"""
+    driver = _start_driver(request.config)
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture(autouse=True)
+def reset_simulation(request):
+    """Reset app state after tests marked mutates so the next test starts clean"""
+    yield
+    if request.node.get_closest_marker("mutates"):
+        request.getfixturevalue("shared_driver").execute_script("window.__resetSim()")
+
+
+@pytest.fixture(scope="session")
+def elements(shared_driver):
+    """WebElements by id, fetched in one round trip and reused by every test
+
+    References stay valid because the suite never navigates away from the page.
+    """
+    found = shared_driver.execute_script(
+        "return arguments[0].map(id => document.getElementById(id));",
+        list(ELEMENT_IDS)
+    )
+    return dict(zip(ELEMENT_IDS, found))
@@ -52,6 +52,10 @@ class FestivalApp {
         // Start simulation
         this.simulation.start();
 
+        // Signal readiness to UI tests and let them reset state between runs
+        window.__resetSim = () => this.reset();
+        window.simulationReady = true;
+
         // Handle window resize
         window.addEventListener('resize', () => this.simulation.resize());
     }
@@ -106,6 +110,22 @@ class FestivalApp {
         });
     }
 
+    reset() {
+        this.simulation.reset();
+        this.elements.pauseBtn.textContent = 'Pause';
+        this.elements.pauseBtn.className = 'pause';
+        this.elements.pauseBtn.setAttribute('aria-pressed', false);
+        this.elements.showPathsBtn.textContent = 'Show All Paths';
+        this.elements.showPathsBtn.setAttribute('aria-pressed', false);
+        const displaySpeed = (CONFIG.DEFAULT_SIMULATION_SPEED / 40.0).toFixed(1);
+        this.elements.speedSlider.value = CONFIG.DEFAULT_SIMULATION_SPEED;
+        this.elements.speedSlider.setAttribute('aria-valuenow', CONFIG.DEFAULT_SIMULATION_SPEED.toFixed(1));
+        this.elements.speedSlider.setAttribute('aria-valuetext', displaySpeed + 'x speed');
+        this.elements.speedValue.textContent = displaySpeed + 'x';
+        this.elements.attendeeCount.textContent = `Attendees: ${this.simulation.agents.length}`;
+        this.elements.fps.textContent = `FPS: ${this.simulation.currentFPS}`;
+    }
+
     updateStats(stats) {
         this.elements.attendeeCount.textContent = `Attendees: ${stats.attendeeCount}`;
         this.elements.fps.textContent = `FPS: ${stats.fps}`;
@@ -100,6 +100,23 @@ export class Simulation {
         );
     }
 
+    // Return to the initial state without restarting the animation loop
+    reset() {
+        this.agents = [];
+        this.paused = false;
+        this.simulationSpeed = this.config.DEFAULT_SIMULATION_SPEED;
+        this.simulationTime = 0;
+        this.eventManager = new EventManager(this.config, this.renderer.width, this.renderer.height);
+        this.renderer.showAllPaths = false;
+
+        // Frame timing restarts on the next animation frame
+        this.lastFrameTime = 0;
+        this.lastRenderTime = 0;
+        this.frameCount = 0;
+        this.fpsUpdateTime = 0;
+        this.currentFPS = 0;
+    }
+
     // Event handlers
     triggerLeftConcert() {
         this.eventManager.handleLeftConcert(this.agents);
@@ -1,226 +1,230 @@
 """
 Selenium WebDriver test script for Festival Agent Simulation
 Tests UI rendering and interaction functionality
+
+Run in parallel with: pytest -n 4 test_selenium.py
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
+import argparse
+import logging
+import pytest
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-import time
 import sys
 
-class FestivalSimulationTests:
-    def __init__(self, url="http://localhost:8000"):
-        self.url = url
-        self.driver = None
-        
-    def setup(self):
-        """Initialize the WebDriver"""
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--window-size=1280,800')
-        
-        self.driver = webdriver.Chrome(options=options)
-        self.driver.get(self.url)
-        
-        # Wait for canvas to be ready
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.ID, "canvas"))
-        )
-        time.sleep(2)  # Allow simulation to initialize
-        
-    def teardown(self):
-        """Close the WebDriver"""
-        if self.driver:
-            self.driver.quit()
-            
-    def test_page_loads(self):
-        """Test that the page loads correctly"""
-        print("Test: Page loads correctly")
-        assert "Festival Agent Simulation" in self.driver.title
-        print("✓ Page title is correct")
-        
-    def test_all_controls_present(self):
-        """Test that all control elements are present"""
-        print("\nTest: All controls are present")
-        
-        elements = {
-            "pauseBtn": "Pause button",
-            "leftConcertBtn": "Left Concert button",
-            "rightConcertBtn": "Right Concert button",
-            "busArriveBtn": "Bus Arrives button",
-            "busLeaveBtn": "Bus Leaving button",
-            "speedSlider": "Speed slider"
+log = logging.getLogger(__name__)
+
+# Snapshot of visibility, text, size and requested attributes for a list of
+# element ids, gathered in one WebDriver round trip
+_BATCH_JS = """
+    const [ids, attrNames] = arguments;
+    const out = {};
+    for (const id of ids) {
+        const el = document.getElementById(id);
+        if (!el) {
+            out[id] = null;
+            continue;
         }
-        
-        for elem_id, name in elements.items():
-            element = self.driver.find_element(By.ID, elem_id)
-            assert element.is_displayed(), f"{name} not displayed"
-            print(f"✓ {name} is present and displayed")
-            
-    def test_canvas_present(self):
-        """Test that canvas element exists and has dimensions"""
-        print("\nTest: Canvas is present and sized")
-        canvas = self.driver.find_element(By.ID, "canvas")
-        assert canvas.is_displayed()
-        
-        width = canvas.get_attribute("width")
-        height = canvas.get_attribute("height")
-        assert int(width) > 0, "Canvas width is 0"
-        assert int(height) > 0, "Canvas height is 0"
-        print(f"✓ Canvas is present with dimensions: {width}x{height}")
-        
-    def test_initial_attendee_count(self):
-        """Test that initial attendee count is displayed"""
-        print("\nTest: Initial attendee count")
-        attendee_count = self.driver.find_element(By.ID, "attendeeCount")
-        count_text = attendee_count.text
-        assert "100" in count_text, f"Expected 100 attendees, got: {count_text}"
-        print(f"✓ Initial attendee count is correct: {count_text}")
-        
-    def test_fps_display(self):
-        """Test that FPS is being displayed and updated"""
-        print("\nTest: FPS display")
-        time.sleep(2)  # Wait for FPS to calculate
-        fps_element = self.driver.find_element(By.ID, "fps")
-        fps_text = fps_element.text
-        assert "FPS:" in fps_text
-        print(f"✓ FPS is being displayed: {fps_text}")
-        
-    def test_pause_button(self):
-        """Test pause/resume functionality"""
-        print("\nTest: Pause button functionality")
-        pause_btn = self.driver.find_element(By.ID, "pauseBtn")
-        
-        initial_text = pause_btn.text
-        assert initial_text == "Pause", f"Expected 'Pause', got: {initial_text}"
-        
-        pause_btn.click()
-        time.sleep(0.5)
-        
-        new_text = pause_btn.text
-        assert new_text == "Resume", f"Expected 'Resume' after click, got: {new_text}"
-        print("✓ Pause button toggles correctly")
-        
-        # Resume
-        pause_btn.click()
-        
-    def test_left_concert_button(self):
-        """Test left concert button"""
-        print("\nTest: Left concert button")
-        left_btn = self.driver.find_element(By.ID, "leftConcertBtn")
-        left_btn.click()
-        time.sleep(0.5)
-        print("✓ Left concert button is clickable")
-        
-    def test_right_concert_button(self):
-        """Test right concert button"""
-        print("\nTest: Right concert button")
-        right_btn = self.driver.find_element(By.ID, "rightConcertBtn")
-        right_btn.click()
-        time.sleep(0.5)
-        print("✓ Right concert button is clickable")
-        
-    def test_bus_arrives_button(self):
-        """Test bus arrives button increases attendee count"""
-        print("\nTest: Bus arrives button")
-        
-        # Get initial count
-        attendee_count = self.driver.find_element(By.ID, "attendeeCount")
-        initial_text = attendee_count.text
-        initial_count = int(initial_text.split(":")[1].strip())
-        
-        # Click bus arrives
-        bus_btn = self.driver.find_element(By.ID, "busArriveBtn")
-        bus_btn.click()
-        time.sleep(1)
-        
-        # Check new count
-        new_text = attendee_count.text
-        new_count = int(new_text.split(":")[1].strip())
-        
-        assert new_count > initial_count, f"Attendee count should increase: {initial_count} -> {new_count}"
-        print(f"✓ Bus arrives increases attendee count: {initial_count} -> {new_count}")
-        
-    def test_speed_slider(self):
-        """Test speed slider functionality"""
-        print("\nTest: Speed slider")
-        speed_slider = self.driver.find_element(By.ID, "speedSlider")
-        speed_value = self.driver.find_element(By.ID, "speedValue")
-        
-        initial_value = speed_value.text
-        assert "1.0x" in initial_value, f"Expected initial speed 1.0x, got: {initial_value}"
-        
-        # Change speed using JavaScript (more reliable than dragging in headless mode)
-        self.driver.execute_script("arguments[0].value = 2.0; arguments[0].dispatchEvent(new Event('input'));", speed_slider)
-        time.sleep(0.5)
-        
-        new_value = speed_value.text
-        assert "2.0x" in new_value, f"Expected speed 2.0x, got: {new_value}"
-        print(f"✓ Speed slider updates correctly: {initial_value} -> {new_value}")
-        
-    def test_accessibility_attributes(self):
-        """Test that accessibility attributes are present"""
-        print("\nTest: Accessibility attributes")
-        
-        # Check aria-labels
-        pause_btn = self.driver.find_element(By.ID, "pauseBtn")
-        assert pause_btn.get_attribute("aria-pressed") is not None
-        print("✓ Pause button has aria-pressed attribute")
-        
-        speed_slider = self.driver.find_element(By.ID, "speedSlider")
-        assert speed_slider.get_attribute("aria-label") is not None
-        print("✓ Speed slider has aria-label")
-        
-        canvas = self.driver.find_element(By.ID, "canvas")
-        assert canvas.get_attribute("aria-label") is not None
-        print("✓ Canvas has aria-label")
-        
-    def run_all_tests(self):
-        """Run all tests"""
-        print("=" * 60)
-        print("Festival Agent Simulation - Selenium Tests")
-        print("=" * 60)
-        
-        try:
-            self.setup()
-            
-            # Run all tests
-            self.test_page_loads()
-            self.test_all_controls_present()
-            self.test_canvas_present()
-            self.test_initial_attendee_count()
-            self.test_fps_display()
-            self.test_pause_button()
-            self.test_left_concert_button()
-            self.test_right_concert_button()
-            self.test_bus_arrives_button()
-            self.test_speed_slider()
-            self.test_accessibility_attributes()
-            
-            print("\n" + "=" * 60)
-            print("✓ All tests passed!")
-            print("=" * 60)
-            return True
-            
-        except AssertionError as e:
-            print(f"\n✗ Test failed: {e}")
-            return False
-        except Exception as e:
-            print(f"\n✗ Error during tests: {e}")
-            return False
-        finally:
-            self.teardown()
+        const attrs = {};
+        for (const name of attrNames) {
+            attrs[name] = el.getAttribute(name);
+        }
+        // Approximates WebElement.is_displayed(): a hidden or display:none
+        // element (or ancestor) is not displayed, and neither is one with no area
+        const rect = el.getBoundingClientRect();
+        out[id] = {
+            displayed: getComputedStyle(el).visibility !== 'hidden'
+                && rect.width > 0 && rect.height > 0,
+            text: el.textContent,
+            width: el.width,
+            height: el.height,
+            attrs: attrs
+        };
+    }
+    return out;
+"""
 
-if __name__ == "__main__":
-    # Default URL, can be overridden with command line argument
-    url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8000"
+
+CONTROLS = {
+    "pauseBtn": "Pause button",
+    "leftConcertBtn": "Left Concert button",
+    "rightConcertBtn": "Right Concert button",
+    "busArriveBtn": "Bus Arrives button",
+    "busLeaveBtn": "Bus Leaving button",
+    "speedSlider": "Speed slider"
+}
+
+
+def _dom_snapshot(driver, ids, attrs=()):
+    """Return the _BATCH_JS snapshot for ids, keyed by id"""
+    return driver.execute_script(_BATCH_JS, list(ids), list(attrs))
+
+
+def _attendee_count(driver):
+    """Parse the displayed attendee count in the page, in one round trip"""
+    return driver.execute_script(
+        "return parseInt(document.getElementById('attendeeCount').textContent.split(':')[1], 10);"
+    )
+
+
+@pytest.fixture(scope="module")
+def dom_snapshot(shared_driver):
+    """Snapshot of every control and the canvas shared by the DOM tests"""
+    return _dom_snapshot(shared_driver, list(CONTROLS) + ["canvas"],
+                         ["aria-pressed", "aria-label"])
+
+
+def test_page_loads(shared_driver):
+    """Test that the page loads correctly"""
+    log.info("Test: Page loads correctly")
+    assert "Festival Agent Simulation" in shared_driver.title
+    log.info("✓ Page title is correct")
+
+
+def test_all_controls_present(dom_snapshot):
+    """Test that all control elements are present"""
+    log.info("Test: All controls are present")
+    
+    for elem_id, name in CONTROLS.items():
+        assert dom_snapshot[elem_id] is not None, f"{name} not found"
+        assert dom_snapshot[elem_id]["displayed"], f"{name} not displayed"
+        log.info(f"✓ {name} is present and displayed")
+
+
+def test_canvas_present(dom_snapshot):
+    """Test that canvas element exists and has dimensions"""
+    log.info("Test: Canvas is present and sized")
+    canvas = dom_snapshot["canvas"]
+    assert canvas is not None, "Canvas not found"
+    assert canvas["displayed"]
     
-    tests = FestivalSimulationTests(url)
-    success = tests.run_all_tests()
+    width = canvas["width"]
+    height = canvas["height"]
+    assert int(width) > 0, "Canvas width is 0"
+    assert int(height) > 0, "Canvas height is 0"
+    log.info(f"✓ Canvas is present with dimensions: {width}x{height}")
+
+
+def test_initial_attendee_count(shared_driver):
+    """Test that initial attendee count is displayed"""
+    log.info("Test: Initial attendee count")
+    # Fans only arrive by bus or car, so the festival starts empty
+    count = _attendee_count(shared_driver)
+    assert count == 0, f"Expected 0 attendees, got: {count}"
+    log.info(f"✓ Initial attendee count is correct: {count}")
+
+
+def test_fps_display(shared_driver, elements):
+    """Test that FPS is being displayed and updated"""
+    log.info("Test: FPS display")
+    fps_element = elements["fps"]
+    # Wait for FPS to calculate
+    WebDriverWait(shared_driver, 3).until(lambda d: fps_element.text != "FPS: 0")
+    fps_text = fps_element.text
+    assert "FPS:" in fps_text
+    log.info(f"✓ FPS is being displayed: {fps_text}")
+
+
+@pytest.mark.mutates
+def test_pause_button(shared_driver):
+    """Test pause/resume functionality"""
+    log.info("Test: Pause button functionality")
     
-    sys.exit(0 if success else 1)
+    # Click handlers run synchronously, so read the text before and after in one script
+    texts = shared_driver.execute_script("""
+        const btn = document.getElementById('pauseBtn');
+        const before = btn.textContent;
+        btn.click();
+        return {before: before, after: btn.textContent};
+    """)
+    
+    assert texts["before"] == "Pause", f"Expected 'Pause', got: {texts['before']}"
+    assert texts["after"] == "Resume", f"Expected 'Resume' after click, got: {texts['after']}"
+    log.info("✓ Pause button toggles correctly")
+
+
+@pytest.mark.mutates
+def test_left_concert_button(elements):
+    """Test left concert button"""
+    log.info("Test: Left concert button")
+    left_btn = elements["leftConcertBtn"]
+    left_btn.click()
+    log.info("✓ Left concert button is clickable")
+
+
+@pytest.mark.mutates
+def test_right_concert_button(elements):
+    """Test right concert button"""
+    log.info("Test: Right concert button")
+    right_btn = elements["rightConcertBtn"]
+    right_btn.click()
+    log.info("✓ Right concert button is clickable")
+
+
+@pytest.mark.mutates
+def test_bus_arrives_button(shared_driver, elements):
+    """Test bus arrives button increases attendee count"""
+    log.info("Test: Bus arrives button")
+    
+    initial_count = _attendee_count(shared_driver)
+    
+    elements["busArriveBtn"].click()
+    # Attendee count is refreshed with the once-per-second stats update
+    WebDriverWait(shared_driver, 3).until(lambda d: _attendee_count(d) > initial_count)
+    
+    new_count = _attendee_count(shared_driver)
+    assert new_count > initial_count, f"Attendee count should increase: {initial_count} -> {new_count}"
+    log.info(f"✓ Bus arrives increases attendee count: {initial_count} -> {new_count}")
+
+
+@pytest.mark.mutates
+def test_speed_slider(shared_driver):
+    """Test speed slider functionality"""
+    log.info("Test: Speed slider")
+    
+    # Change speed using JavaScript (more reliable than dragging in headless mode).
+    # The input handler runs synchronously under dispatchEvent, so the new
+    # label is already rendered when the script returns. 80 is the slider
+    # maximum, displayed as 2.0x.
+    values = shared_driver.execute_script("""
+        const slider = document.getElementById('speedSlider');
+        const label = document.getElementById('speedValue');
+        const before = label.textContent;
+        slider.value = 80.0;
+        slider.dispatchEvent(new Event('input'));
+        return {before: before, after: label.textContent};
+    """)
+    
+    initial_value = values["before"]
+    assert "1.0x" in initial_value, f"Expected initial speed 1.0x, got: {initial_value}"
+    
+    new_value = values["after"]
+    assert "2.0x" in new_value, f"Expected speed 2.0x, got: {new_value}"
+    log.info(f"✓ Speed slider updates correctly: {initial_value} -> {new_value}")
+
+
+def test_accessibility_attributes(dom_snapshot):
+    """Test that accessibility attributes are present"""
+    log.info("Test: Accessibility attributes")
+    
+    assert dom_snapshot["pauseBtn"]["attrs"]["aria-pressed"] is not None
+    log.info("✓ Pause button has aria-pressed attribute")
+    
+    assert dom_snapshot["speedSlider"]["attrs"]["aria-label"] is not None
+    log.info("✓ Speed slider has aria-label")
+    
+    assert dom_snapshot["canvas"]["attrs"]["aria-label"] is not None
+    log.info("✓ Canvas has aria-label")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    # Default URL, can be overridden with command line argument
+    parser.add_argument("url", nargs="?", default="http://localhost:8000")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="log test progress to the console")
+    args = parser.parse_args()
+
+    pytest_args = [__file__, "--url", args.url]
+    if args.verbose:
+        pytest_args += ["-o", "log_cli=true", "--log-cli-level=INFO"]
+    sys.exit(pytest.main(pytest_args))